@@ -1,5 +1,8 @@
 """Django AppSettings package."""
 import os
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Type, cast
 
 from django.core.exceptions import ImproperlyConfigured
 from django.core.signals import setting_changed
@@ -28,6 +31,8 @@ from .validators import (
     DictKeysTypeValidator,
     DictValuesTypeValidator,
     FileValidator,
+    LengthRangeValidator,
+    RangeValidator,
     TypeValidator,
     ValuesTypeValidator,
 )
@@ -43,6 +48,7 @@ __all__ = (
     "FloatSetting",
     "IntegerSetting",
     "IterableSetting",
+    "LengthRangeValidator",
     "ListSetting",
     "NestedDictSetting",
     "NestedListSetting",
@@ -50,6 +56,7 @@ __all__ = (
     "ObjectSetting",
     "PositiveFloatSetting",
     "PositiveIntegerSetting",
+    "RangeValidator",
     "SetSetting",
     "Setting",
     "StringSetting",
@@ -59,13 +66,75 @@ __all__ = (
 )
 
 
+class _DefaultMeta(object):
+    """Default ``Meta`` class of ``AppSettings`` subclasses which do not declare one."""
+
+    setting_prefix = ""
+
+
+class _SettingDescriptor(object):
+    """
+    Descriptor giving access to a setting declared in an ``AppSettings`` class.
+
+    Accessed on the class, it returns the setting object itself. Accessed on
+    an instance, it returns the setting value, caching it in the instance.
+
+    This is deliberately a non-data descriptor (no ``__set__``): once cached in
+    the instance dictionary, the value takes precedence over the descriptor.
+    """
+
+    __slots__ = ("item", "setting", "get_value")
+
+    def __init__(self, item, setting):
+        """
+        Initialization method.
+
+        Args:
+            item (str): the name of the setting variable (not the setting's name).
+            setting (Setting): the setting object.
+        """
+        self.item = item
+        self.setting = setting
+        self.get_value = setting.get_value
+
+    def __get__(self, instance, owner):
+        """
+        Return the setting object, or the setting value if accessed on an instance.
+
+        The value is cached as a plain instance attribute, so that subsequent
+        accesses are resolved by Python without calling this method.
+
+        Args:
+            instance (AppSettings): the instance the setting is accessed on, if any.
+            owner (type): the ``AppSettings`` subclass.
+
+        Returns:
+            object: the setting object or the setting value.
+        """
+        if instance is None:
+            return self.setting
+        # This method is only called when the value is not in the instance dictionary.
+        value = instance.__dict__[self.item] = self.get_value()
+        return value
+
+
 class _Metaclass(type):
     """
     ``AppSettings``'s metaclass.
 
     Each setting object declared in the class will be populated (name, prefix)
-    and moved into the _meta.settings dictionary. A reference to this
-    dictionary will also be added in the class as ``settings``.
+    and moved into the _meta.settings read-only mapping. A reference to this
+    mapping will also be added in the class as ``settings``, and their bound
+    check methods are gathered in the _meta.checks tuple, and their full names
+    are mapped to the tuples of their variable names in _meta.full_names. The setting
+    variables are replaced by descriptors returning the setting object when
+    accessed on the class, and the setting value when accessed on an instance.
+    Settings of parent classes are inherited and included in these mappings.
+    Declaring a setting named like an ``AppSettings`` attribute is an error.
+
+    The class is connected once to the Django ``setting_changed`` signal, and
+    dispatches it to its live instances, tracked in a weak set, when the
+    changed setting is one of its own.
     """
 
     def __new__(mcs, cls, bases, dct):
@@ -80,7 +149,7 @@ class _Metaclass(type):
         Returns:
             class: the new created class.
         """
-        super_new = super(_Metaclass, mcs).__new__
+        super_new = super().__new__
 
         # Also ensure initialization is only performed for subclasses
         # of AppSettings (excluding AppSettings class itself).
@@ -88,99 +157,75 @@ class _Metaclass(type):
         if not parents:
             return super_new(mcs, cls, bases, dct)
 
-        new_attr = {}
-        _meta = dct.pop("Meta", type("Meta", (), {"setting_prefix": ""}))()
-        _meta.settings = {}
+        _meta = dct.pop("Meta", _DefaultMeta)()
+        own_settings = {name: value for name, value in dct.items() if isinstance(value, Setting)}
+        new_attr = dict(dct)
 
-        for name, setting in dct.items():
-            if isinstance(setting, Setting):
-                _meta.settings[name] = setting
-                # populate name
-                if setting.name == "":
-                    setting.name = name
-                # populate prefix
-                if setting.prefix == "":
-                    setting.prefix = _meta.setting_prefix
-            else:
-                new_attr[name] = setting
+        # Settings of parent classes are inherited, and can be overridden.
+        _meta.settings = {}
+        for parent in reversed(parents):
+            if parent is not AppSettings:
+                _meta.settings.update(cast("Type[AppSettings]", parent).settings)
+        _meta.settings.update(own_settings)
+
+        for name, setting in own_settings.items():
+            if hasattr(AppSettings, name):
+                raise ImproperlyConfigured(
+                    "Setting %s of %s conflicts with the AppSettings attribute of the same name" % (name, cls)
+                )
+            # populate name
+            if setting.name == "":
+                setting.name = name
+            # populate prefix
+            if setting.prefix == "":
+                setting.prefix = _meta.setting_prefix
+            new_attr[name] = _SettingDescriptor(name, setting)
+        _meta.settings = MappingProxyType(_meta.settings)
+        _meta.checks = tuple(setting.check for setting in _meta.settings.values())
         new_attr["_meta"] = _meta
         new_attr["settings"] = _meta.settings
+        new_attr["_instances"] = weakref.WeakSet()
 
-        return super_new(mcs, cls, bases, new_attr)
-
-    def __getattr__(cls, item):
-        """
-        Return a setting object if it is in the ``_meta.settings`` dictionary.
-
-        Args:
-            item (str):
-                the name of the setting variable (not the setting's name).
-
-        Returns:
-            ``Setting``: the setting object.
-
-        Raises:
-            AttributeError if the setting does not exist.
-        """
-        if item in cls._meta.settings.keys():
-            return cls._meta.settings[item]
-        raise AttributeError("'%s' class has no attribute '%s'" % (cls.__name__, item))
+        new_class = cast("Type[AppSettings]", super_new(mcs, cls, bases, new_attr))
+        full_names = {}  # type: Dict[str, Tuple[str, ...]]
+        for name, setting in _meta.settings.items():
+            full_names[setting.full_name] = full_names.get(setting.full_name, ()) + (name,)
+        _meta.full_names = full_names
+        _meta.env_override_keys = {
+            full_name: new_class.OS_ENVIRON_OVERRIDE_PREFIX + full_name for full_name in _meta.full_names
+        }
+        setting_changed.connect(new_class._on_setting_changed)
+        return new_class
 
 
 class AppSettings(metaclass=_Metaclass):
     """
     Base class for application settings.
 
-    Only use this class as a parent class for inheritance. If you try to
-    access settings directly in ``AppSettings``, it will raise a
-    RecursionError. Some protections have been added to prevent you from
-    instantiating this very class, or to return immediately when running
-    ``AppSettings.check()``, but trying to access attributes on the class is
-    not yet prevented.
+    Only use this class as a parent class for inheritance. Some protections
+    have been added to prevent you from instantiating this very class, or to
+    return immediately when running ``AppSettings.check()``.
 
     """
 
     OS_ENVIRON_OVERRIDE_PREFIX = "__DAP_"  # type: str
 
+    # Set on each subclass by the metaclass.
+    settings = MappingProxyType({})  # type: Mapping[str, Setting]
+    _meta = None  # type: Any
+    _instances = weakref.WeakSet()  # type: weakref.WeakSet
+
     def __init__(self):
         """
         Initialization method.
 
-        The ``invalidate_cache`` and ``manage_environ_invalidation`` methods will be connected to the Django
-        ``setting_changed`` signal in this method, with the dispatch UIDs being method initials and the id of this very
-        object (``id(self)``).
+        The instance is registered in its class set of instances, so that its ``invalidate_cache`` and
+        ``manage_environ_invalidation`` methods are called when the Django ``setting_changed`` signal is received by
+        the class.
         """
         if self.__class__ == AppSettings:
             raise RuntimeError("Do not use AppSettings class as itself, " "use it as a base for subclasses")
-        setting_changed.connect(self.invalidate_cache, dispatch_uid="ic" + str(id(self)))
-        setting_changed.connect(self.manage_environ_invalidation, dispatch_uid="mei" + str(id(self)))
-        self._cache = {}
-
-    def __getattr__(self, item):
-        """
-        Return a setting value.
-
-        The caching is done here. If the setting exists, and if it's variable
-        name is in the cache dictionary, return the cached value. If there
-        is no cached value, get the setting value with ``setting.get_value()``,
-        cache it, and return it.
-
-        Args:
-            item (str):
-                the name of the setting variable (not the setting's name).
-
-        Returns:
-            object: a setting value.
-
-        Raises:
-            AttributeError if the setting does not exist.
-        """
-        if item in self.settings.keys():
-            if item in self._cache:
-                return self._cache[item]
-            value = self._cache[item] = self.settings[item].get_value()
-            return value
-        raise AttributeError("'%s' object has no attribute '%s'" % (repr(self), item))
+        self._instances.add(self)
 
     @classmethod
     def check(cls):
@@ -189,17 +234,26 @@ class AppSettings(metaclass=_Metaclass):
 
         Will raise an ``ImproperlyConfigured`` exception with explanation.
         """
-        if cls == AppSettings:
+        if cls is AppSettings or not cls.settings:
             return None
 
         exceptions = []
-        for setting in cls.settings.values():
+        for check in cls._meta.checks:
             try:
-                setting.check()
+                check()
             except ImproperlyConfigured as error:
-                exceptions.append(str(error))
+                exceptions.append(error)
         if exceptions:
-            raise ImproperlyConfigured("\n".join(exceptions))
+            raise ImproperlyConfigured("\n".join(str(error) for error in exceptions))
+
+    @classmethod
+    def _on_setting_changed(cls, **kwargs):
+        """Dispatch the ``setting_changed`` signal to every live instance of the class, if the setting is ours."""
+        if kwargs.get("setting") not in cls._meta.full_names:
+            return
+        for instance in tuple(cls._instances):
+            instance.invalidate_cache(**kwargs)
+            instance.manage_environ_invalidation(**kwargs)
 
     def manage_environ_invalidation(self, *, setting, enter, **kwargs):
         """
@@ -210,17 +264,43 @@ class AppSettings(metaclass=_Metaclass):
         To be able to restore the original value later, we add a prefix (OS_ENVIRON_OVERRIDE_PREFIX) to the key and then
         just remove the prefix.
         """
-        for item in self.settings.keys():
-            if self.settings[item].full_name == setting:
-                setting_override_key = self.OS_ENVIRON_OVERRIDE_PREFIX + setting
-                if enter and setting in os.environ:
-                    os.environ[setting_override_key] = os.environ[setting]
-                    del os.environ[setting]
-                elif not enter and setting_override_key in os.environ:
-                    os.environ[setting] = os.environ[setting_override_key]
-                    del os.environ[setting_override_key]
-                break
-
-    def invalidate_cache(self, **kwargs):
-        """Invalidate cache. Run when receive ``setting_changed`` signal."""
-        self._cache = {}
+        setting_override_key = self._meta.env_override_keys.get(setting)
+        if setting_override_key is None:
+            return
+        environ = os.environ
+        if enter:
+            value = environ.pop(setting, None)
+            if value is not None:
+                environ[setting_override_key] = value
+        else:
+            value = environ.pop(setting_override_key, None)
+            if value is not None:
+                environ[setting] = value
+
+    def preload(self):
+        """
+        Load and cache the values of every setting.
+
+        Call it at startup, for example in ``AppConfig.ready()``, to import objects and compute values once instead
+        of on first access, which might happen concurrently in request-serving threads.
+        """
+        for item in self.settings:
+            getattr(self, item)
+
+    def invalidate_cache(self, setting=None, **kwargs):
+        """
+        Invalidate cache. Run when receive ``setting_changed`` signal.
+
+        When the name of the changed setting is given, only the cached value of the corresponding setting is dropped,
+        and nothing is done if the changed setting is not declared in this class. Without a setting name, the whole
+        cache is cleared.
+
+        Args:
+            setting (str): the full name of the changed setting.
+        """
+        if setting is None:
+            for item in self.settings:
+                self.__dict__.pop(item, None)
+            return
+        for item in self._meta.full_names.get(setting, ()):
+            self.__dict__.pop(item, None)
@@ -4,27 +4,117 @@ Settings module.
 This module defines the settings classes.
 """
 
+import functools
 import importlib
-import itertools
-import json
 import os
+import sys
 import warnings
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, cast
+from types import FrameType
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, cast
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
-from django.core.validators import MaxLengthValidator, MaxValueValidator, MinLengthValidator, MinValueValidator
 
 from .validators import (
     DictKeysTypeValidator,
     DictValuesTypeValidator,
     FileValidator,
+    LengthRangeValidator,
+    RangeValidator,
     TypeValidator,
     ValuesTypeValidator,
 )
 
 
+def _identity(value):
+    """Return the value unchanged."""
+    return value
+
+
+# Setting classes and deprecated arguments for which a warning was already emitted.
+_emitted_deprecations = set()  # type: Set[Tuple[type, Optional[str]]]
+
+
+def _warn_deprecated(setting, argument, message):
+    """
+    Emit a deprecation warning, only once per setting class and argument.
+
+    The warning is attributed to the first caller outside of this module.
+
+    Args:
+        setting (Setting): the setting using the deprecated feature.
+        argument (str): the deprecated argument, or None if the class itself is deprecated.
+        message (str): the warning message.
+    """
+    key = (type(setting), argument)
+    if key in _emitted_deprecations:
+        return
+    _emitted_deprecations.add(key)
+    stacklevel = 2
+    frame = sys._getframe(1)  # type: Optional[FrameType]
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+        stacklevel += 1
+    warnings.warn(message, DeprecationWarning, stacklevel=stacklevel)
+
+
+# Accepted environment values for boolean settings.
+_BOOLEAN_VALUES = {"true": True, "yes": True, "1": True, "false": False, "no": False, "0": False}
+
+# Characters a JSON document can start with, apart from the literals below.
+_JSON_START_CHARS = frozenset('{["-0123456789')
+
+# JSON documents made of a single literal, including NaN and Infinity.
+_JSON_LITERALS = frozenset(("true", "false", "null", "NaN", "Infinity"))
+
+
+@functools.lru_cache(maxsize=None)
+def _split_object_path(path):
+    """
+    Split a dotted path into the path of its deepest importable module and the names of the objects below it.
+
+    The result is cached: the module is imported once to find the split, while the objects are still obtained on
+    each call so that patching them is honored.
+
+    Args:
+        path (str): the dot-separated path of the object.
+
+    Returns:
+        tuple: the module path and a tuple of object names.
+
+    Raises:
+        ImportError: if no module of the path can be imported.
+    """
+    parent_module_path, _, name = path.rpartition(".")
+    if not parent_module_path:
+        # A path without dots is the path of a top-level module, imported by the caller.
+        return path, ()
+    names = [name]
+    while parent_module_path:
+        if sys.modules.get(parent_module_path) is None:
+            try:
+                importlib.import_module(parent_module_path)
+            except ImportError:
+                parent_module_path, _, name = parent_module_path.rpartition(".")
+                names.append(name)
+                continue
+        return parent_module_path, tuple(reversed(names))
+    raise ImportError("No module named '%s'" % name)
+
+
+@functools.lru_cache(maxsize=128)
+def _to_path(value):
+    """Return a path for the value, reusing the instances built for previous values (paths are immutable)."""
+    return Path(value)
+
+
+def _may_be_json(value):
+    """Tell if the string may be a JSON document, to avoid a failing ``json.loads`` for plain strings."""
+    value = value.strip()
+    return bool(value) and (value[0] in _JSON_START_CHARS or value in _JSON_LITERALS)
+
+
 class Setting(object):
     """
     Base setting class.
@@ -52,6 +142,21 @@ class Setting(object):
         default_validators (list of callables): Default set of validators for the setting.
     """
 
+    __slots__ = (
+        "_name",
+        "_prefix",
+        "_full_name",
+        "default",
+        "call_default",
+        "transform_default",
+        "required",
+        "_parent_setting",
+        "_fetch_raw",
+        "nested_list_index",
+        "validators",
+        "_env_deprecation_warned",
+    )
+
     default_validators = ()  # type: Iterable[Callable]
 
     def __init__(
@@ -77,33 +182,119 @@ class Setting(object):
             transform_default (bool): whether to transform the default value.
             validators (list of callables): list of additional validators to use.
         """
-        self.name = name
+        self._name = name
+        self._prefix = prefix
+        self._full_name = prefix.upper() + name.upper()
         self.default = default
         self.call_default = call_default
         self.transform_default = transform_default
         self.required = required
-        self.prefix = prefix
-        self.parent_setting = None  # type: Optional[Setting]
+        self.parent_setting = None
         self.nested_list_index = None
-        self.validators = list(itertools.chain(self.default_validators, validators))
+        if validators:
+            self.validators = [*self.default_validators, *validators]
+        else:
+            self.validators = list(self.default_validators)
+        self._env_deprecation_warned = False
 
     def _reraise_if_required(self, err):
         if self.required:
             if isinstance(err, KeyError):
-                msg = "%s setting is missing required item %s" % (cast(Setting, self.parent_setting).full_name, err)
+                msg = "%s setting is missing required item %s" % (cast(Setting, self._parent_setting).full_name, err)
             else:
                 msg = "%s setting is required and %s" % (self.full_name, err)
             raise ImproperlyConfigured(msg)
 
+    @property
+    def name(self):
+        """
+        Property to return the name of the setting.
+
+        Returns:
+            str: the name of the setting.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._full_name = self._prefix.upper() + value.upper()
+
+    @property
+    def prefix(self):
+        """
+        Property to return the prefix of the setting.
+
+        Returns:
+            str: the prefix of the setting.
+        """
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, value):
+        self._prefix = value
+        self._full_name = value.upper() + self._name.upper()
+
     @property
     def full_name(self):
         """
         Property to return the full name of the setting.
 
+        The full name is computed when the name or the prefix is set.
+
         Returns:
             str: upper prefix + upper name.
         """
-        return self.prefix.upper() + self.name.upper()
+        return self._full_name
+
+    @property
+    def parent_setting(self):
+        """
+        Property to return the parent setting, if any.
+
+        Returns:
+            Setting: the nested setting this setting belongs to, or None.
+        """
+        return self._parent_setting
+
+    @parent_setting.setter
+    def parent_setting(self, value):
+        # type: (Optional[Setting]) -> None
+        self._parent_setting = value
+        if value is None:
+            self._fetch_raw = Setting._fetch_from_django_or_env
+        else:
+            self._fetch_raw = value._get_child_fetcher()
+
+    def _get_child_fetcher(self):
+        """
+        Return the function a child setting uses to fetch its raw value.
+
+        Nested settings override this to read the value from their own raw value.
+        The function is unbound and called with the child setting, so that
+        copies of the child fetch their own value.
+
+        Returns:
+            callable: the function to call with the child to get its raw value.
+        """
+        return Setting._fetch_from_django_or_env
+
+    def _fetch_from_django_or_env(self):
+        environ_value = os.environ.get(self._full_name)
+        if environ_value is None:
+            return getattr(settings, self._full_name)
+        if not self._env_deprecation_warned:
+            warnings.warn("Loading setting values from environment is deprecated.", DeprecationWarning)
+            self._env_deprecation_warned = True
+        return self.decode_environ(environ_value)
+
+    def _fetch_from_nested_dict(self):
+        # Only installed by the parent_setting setter when the parent is set.
+        return cast(Setting, self._parent_setting).raw_value[self._full_name]
+
+    def _fetch_from_nested_list(self):
+        # Only installed by the parent_setting setter when the parent is set.
+        return cast(Setting, self._parent_setting).raw_value[self.nested_list_index]
 
     @property
     def default_value(self):
@@ -132,15 +323,7 @@ class Setting(object):
             AttributeError: if the variable is missing.
             KeyError: if the item is missing from nested setting.
         """
-        if isinstance(self.parent_setting, NestedDictSetting):
-            return self.parent_setting.raw_value[self.full_name]
-        elif isinstance(self.parent_setting, NestedListSetting):
-            return self.parent_setting.raw_value[self.nested_list_index]
-        elif self.full_name in os.environ:
-            warnings.warn("Loading setting values from environment is deprecated.", DeprecationWarning)
-            return self.decode_environ(os.environ[self.full_name])
-        else:
-            return getattr(settings, self.full_name)
+        return self._fetch_raw(self)
 
     @property
     def value(self):
@@ -195,8 +378,11 @@ class Setting(object):
 
     def run_validators(self, value):
         """Run the validators on the setting value."""
+        validators = self.validators
+        if not validators:
+            return
         errors = []  # type: List[str]
-        for validator in self.validators:
+        for validator in validators:
             try:
                 validator(value)
             except ValidationError as error:
@@ -248,12 +434,16 @@ class Setting(object):
         Returns:
             Any: the decoded value
         """
+        import json  # Imported on first use: loading values from environment is deprecated.
+
         return json.loads(value)
 
 
 class BooleanSetting(Setting):
     """Boolean setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(bool),)
 
     def __init__(
@@ -302,17 +492,17 @@ class BooleanSetting(Setting):
         Returns:
             bool:
         """
-        if value.lower() in ("true", "yes", "1"):
-            return True
-        elif value.lower() in ("false", "no", "0"):
-            return False
-        else:
+        decoded = _BOOLEAN_VALUES.get(value.lower())
+        if decoded is None:
             raise ValueError("Invalid boolean setting %s in environ (%s)" % (self.full_name, value))
+        return decoded
 
 
 class IntegerSetting(Setting):
     """Integer setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(int),)
 
     def __init__(
@@ -351,15 +541,15 @@ class IntegerSetting(Setting):
             transform_default=transform_default,
             validators=validators,
         )
-        if minimum is not None:
-            self.validators.append(MinValueValidator(minimum))
-        if maximum is not None:
-            self.validators.append(MaxValueValidator(maximum))
+        if minimum is not None or maximum is not None:
+            self.validators.append(RangeValidator(minimum, maximum))
 
 
 class PositiveIntegerSetting(IntegerSetting):
     """Positive integer setting."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name="",
@@ -401,6 +591,8 @@ class PositiveIntegerSetting(IntegerSetting):
 class FloatSetting(IntegerSetting):
     """Float setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(float),)
 
     def __init__(
@@ -446,6 +638,8 @@ class FloatSetting(IntegerSetting):
 class PositiveFloatSetting(FloatSetting):
     """Positive float setting."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name="",
@@ -488,6 +682,8 @@ class PositiveFloatSetting(FloatSetting):
 class IterableSetting(Setting):
     """Iterable setting."""
 
+    __slots__ = ("item_type", "delimiter")
+
     def __init__(
         self,
         name="",
@@ -535,13 +731,11 @@ class IterableSetting(Setting):
         if item_type is not None:
             self.validators.append(ValuesTypeValidator(item_type))
         if empty is not None:
-            warnings.warn("Empty argument is deprecated, use min_length instead.", DeprecationWarning)
+            _warn_deprecated(self, "empty", "Empty argument is deprecated, use min_length instead.")
             if not empty:
                 min_length = 1
-        if min_length is not None:
-            self.validators.append(MinLengthValidator(min_length))
-        if max_length is not None:
-            self.validators.append(MaxLengthValidator(max_length))
+        if min_length is not None or max_length is not None:
+            self.validators.append(LengthRangeValidator(min_length, max_length))
 
     def decode_environ(self, value):
         """
@@ -555,18 +749,22 @@ class IterableSetting(Setting):
         Returns:
             Iterable:
         """
-        try:
-            value = super().decode_environ(value)
-        except json.decoder.JSONDecodeError:
-            split_value = value.split(self.delimiter)
-            item_convert_func = self.item_type or (lambda v: v)
-            value = [item_convert_func(v) for v in split_value]
+        if _may_be_json(value):
+            try:
+                return super().decode_environ(value)
+            except ValueError:  # json.JSONDecodeError
+                pass
+        value = value.split(self.delimiter)
+        if self.item_type is not None:
+            value = [self.item_type(v) for v in value]
         return value
 
 
 class StringSetting(Setting):
     """String setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(str),)
 
     def __init__(
@@ -608,13 +806,11 @@ class StringSetting(Setting):
             validators=validators,
         )
         if empty is not None:
-            warnings.warn("Empty argument is deprecated, use min_length instead.", DeprecationWarning)
+            _warn_deprecated(self, "empty", "Empty argument is deprecated, use min_length instead.")
             if not empty:
                 min_length = 1
-        if min_length is not None:
-            self.validators.append(MinLengthValidator(min_length))
-        if max_length is not None:
-            self.validators.append(MaxLengthValidator(max_length))
+        if min_length is not None or max_length is not None:
+            self.validators.append(LengthRangeValidator(min_length, max_length))
 
     def decode_environ(self, value):
         """
@@ -628,16 +824,19 @@ class StringSetting(Setting):
         Returns:
             string:
         """
-        try:
-            value = super().decode_environ(value)
-        except json.decoder.JSONDecodeError:
-            value = str(value)
-        return value
+        if _may_be_json(value):
+            try:
+                return super().decode_environ(value)
+            except ValueError:  # json.JSONDecodeError
+                pass
+        return str(value)
 
 
 class ListSetting(IterableSetting):
     """List setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(list),)
 
     def __init__(self, name="", default=list, **kwargs):
@@ -678,6 +877,8 @@ class ListSetting(IterableSetting):
 class SetSetting(IterableSetting):
     """Set setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(set),)
 
     def __init__(self, name="", default=set, **kwargs):
@@ -718,6 +919,8 @@ class SetSetting(IterableSetting):
 class TupleSetting(IterableSetting):
     """Tuple setting."""
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(tuple),)
 
     def __init__(self, name="", default=tuple, **kwargs):
@@ -759,6 +962,8 @@ class TupleSetting(IterableSetting):
 class DictSetting(Setting):
     """Dict setting."""
 
+    __slots__ = ("key_type", "value_type", "outer_delimiter", "inner_delimiter")
+
     default_validators = (TypeValidator(dict),)
 
     def __init__(
@@ -816,12 +1021,12 @@ class DictSetting(Setting):
         if value_type is not None:
             self.validators.append(DictValuesTypeValidator(value_type))
         if empty is not None:
-            warnings.warn("Empty argument is deprecated, use MinLengthValidator instead.", DeprecationWarning)
-            self.validators.append(MinLengthValidator(1))
+            _warn_deprecated(self, "empty", "Empty argument is deprecated, use MinLengthValidator instead.")
+            self.validators.append(LengthRangeValidator(1))
         if min_length is not None:
-            warnings.warn("Argument min_length does nothing and is deprecated.", DeprecationWarning)
+            _warn_deprecated(self, "min_length", "Argument min_length does nothing and is deprecated.")
         if max_length is not None:
-            warnings.warn("Argument max_length does nothing and is deprecated.", DeprecationWarning)
+            _warn_deprecated(self, "max_length", "Argument max_length does nothing and is deprecated.")
 
     def decode_environ(self, value):
         """
@@ -839,16 +1044,18 @@ class DictSetting(Setting):
         Returns:
             dict:
         """
-        try:
-            value = super().decode_environ(value)
-        except json.decoder.JSONDecodeError:
-            key_func = self.key_type or (lambda v: v)
-            value_func = self.value_type or (lambda v: v)
-            value = {
-                key_func(k): value_func(v)
-                for k, v in [value.split(self.inner_delimiter, 2) for value in value.split(self.outer_delimiter)]
-            }
-        return value
+        if _may_be_json(value):
+            try:
+                return super().decode_environ(value)
+            except ValueError:  # json.JSONDecodeError
+                pass
+        key_func = self.key_type or _identity
+        value_func = self.value_type or _identity
+        inner_delimiter = self.inner_delimiter
+        return {
+            key_func(k): value_func(v)
+            for k, v in (item.split(inner_delimiter, 1) for item in value.split(self.outer_delimiter))
+        }
 
 
 # Complex settings ------------------------------------------------------------
@@ -859,6 +1066,8 @@ class ObjectSetting(Setting):
     This setting allows to return an object given its Python path (a.b.c).
     """
 
+    __slots__ = ()
+
     default_validators = (TypeValidator(str),)
 
     def __init__(
@@ -900,11 +1109,11 @@ class ObjectSetting(Setting):
             validators=validators,
         )
         if min_length is not None:
-            warnings.warn("Argument min_length does nothing and is deprecated.", DeprecationWarning)
+            _warn_deprecated(self, "min_length", "Argument min_length does nothing and is deprecated.")
         if max_length is not None:
-            warnings.warn("Argument max_length does nothing and is deprecated.", DeprecationWarning)
+            _warn_deprecated(self, "max_length", "Argument max_length does nothing and is deprecated.")
         if empty is not None:
-            warnings.warn("Argument empty does nothing and is deprecated.", DeprecationWarning)
+            _warn_deprecated(self, "empty", "Argument empty does nothing and is deprecated.")
 
     def transform(self, path):
         """
@@ -925,20 +1134,8 @@ class ObjectSetting(Setting):
         if path is None or not path:
             return None
 
-        obj_parent_modules = path.split(".")
-        objects = [obj_parent_modules.pop(-1)]
-
-        while True:
-            try:
-                parent_module_path = ".".join(obj_parent_modules)
-                parent_module = importlib.import_module(parent_module_path)
-                break
-            except ImportError:
-                if len(obj_parent_modules) == 1:
-                    raise ImportError("No module named '%s'" % obj_parent_modules[0])
-                objects.insert(0, obj_parent_modules.pop(-1))
-
-        current_object = parent_module
+        parent_module_path, objects = _split_object_path(path)
+        current_object = sys.modules.get(parent_module_path) or importlib.import_module(parent_module_path)
         for obj in objects:
             current_object = getattr(current_object, obj)
         return current_object
@@ -953,11 +1150,12 @@ class ObjectSetting(Setting):
         Returns:
             string:
         """
-        try:
-            value = super().decode_environ(value)
-        except json.decoder.JSONDecodeError:
-            value = str(value)
-        return value
+        if _may_be_json(value):
+            try:
+                return super().decode_environ(value)
+            except ValueError:  # json.JSONDecodeError
+                pass
+        return str(value)
 
 
 # Callable path settings ------------------------------------------------------
@@ -968,6 +1166,8 @@ class CallablePathSetting(ObjectSetting):
     This setting value should be string containing a dotted path to a callable.
     """
 
+    __slots__ = ()
+
     def validate(self, value):
         """
         Check whether the value is path to a callable.
@@ -975,7 +1175,7 @@ class CallablePathSetting(ObjectSetting):
         We disregard the raw value and use transformed value instead.
         """
         super().validate(value)
-        transformed_value = self.value
+        transformed_value = self.transform(value)
         if not callable(transformed_value):
             raise ValidationError("Value %(value)s is not a callable.", params={"value": transformed_value})
 
@@ -988,6 +1188,8 @@ class NestedDictSetting(DictSetting):
     Environment variables are not passed to inner settings.
     """
 
+    __slots__ = ("settings",)
+
     def __init__(self, settings, *args, **kwargs):
         """
         Initialization method.
@@ -1015,6 +1217,9 @@ class NestedDictSetting(DictSetting):
             subsetting.parent_setting = self
         self.settings = settings
 
+    def _get_child_fetcher(self):
+        return Setting._fetch_from_nested_dict
+
     def get_value(self):
         """
         Return dictionary with values of subsettings.
@@ -1032,10 +1237,7 @@ class NestedDictSetting(DictSetting):
             return default_value
         else:
             # If setting is defined, load values of all subsettings.
-            value = {}
-            for key, subsetting in self.settings.items():
-                value[key] = subsetting.get_value()
-            return value
+            return {key: subsetting.get_value() for key, subsetting in self.settings.items()}
 
     def check(self):
         """
@@ -1046,7 +1248,6 @@ class NestedDictSetting(DictSetting):
             ValueError: (or other Exception) if the raw value is invalid.
         """
         super().check()
-        errors = []  # type: List[str]
         try:
             raw_value = self.raw_value
         except (AttributeError, KeyError):
@@ -1054,6 +1255,7 @@ class NestedDictSetting(DictSetting):
             pass
         else:
             if raw_value is not None:
+                errors = []  # type: List[str]
                 for subsetting in self.settings.values():
                     try:
                         subsetting.check()
@@ -1066,6 +1268,8 @@ class NestedDictSetting(DictSetting):
 class NestedSetting(NestedDictSetting):
     """Deprecated alias for NestedDictSetting."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Initialization method.
@@ -1087,7 +1291,7 @@ class NestedSetting(NestedDictSetting):
             empty (bool): whether empty iterable is allowed. Deprecated in favor of min_length.
         """
         super().__init__(*args, **kwargs)
-        warnings.warn("NestedSetting is deprecated in favor of NestedDictSetting.", DeprecationWarning)
+        _warn_deprecated(self, None, "NestedSetting is deprecated in favor of NestedDictSetting.")
 
 
 class NestedListSetting(IterableSetting):
@@ -1097,6 +1301,8 @@ class NestedListSetting(IterableSetting):
     Environment variables are not passed to inner settings.
     """
 
+    __slots__ = ("inner_setting",)
+
     def __init__(self, inner_setting, *args, **kwargs):
         """
         Initialization method.
@@ -1124,6 +1330,9 @@ class NestedListSetting(IterableSetting):
         inner_setting.parent_setting = self
         self.inner_setting = inner_setting
 
+    def _get_child_fetcher(self):
+        return Setting._fetch_from_nested_list
+
     def get_value(self):
         try:
             value = self.raw_value
@@ -1134,10 +1343,16 @@ class NestedListSetting(IterableSetting):
                 return self.transform(default_value)
             return default_value
         else:
-            return_value = []
+            inner_setting = self.inner_setting
+            if type(inner_setting).get_value is Setting.get_value:
+                # Each item is present, so getting its value only transforms it.
+                return tuple(map(inner_setting.transform, value))
+            get_inner_value = inner_setting.get_value
+            return_value = []  # type: List[Any]
+            append = return_value.append
             for index, item in enumerate(value):
-                self.inner_setting.nested_list_index = index
-                return_value.append(self.inner_setting.get_value())
+                inner_setting.nested_list_index = index
+                append(get_inner_value())
             return tuple(return_value)
 
     def check(self):
@@ -1148,11 +1363,13 @@ class NestedListSetting(IterableSetting):
         except (AttributeError, KeyError) as err:
             self._reraise_if_required(err)
         else:
+            inner_setting = self.inner_setting
+            check_inner = inner_setting.check
             errors = []  # type: List[str]
             for index, item in enumerate(value):
                 try:
-                    self.inner_setting.nested_list_index = index
-                    self.inner_setting.check()
+                    inner_setting.nested_list_index = index
+                    check_inner()
                 except ValidationError as error:
                     errors.extend(error.messages)
             if errors:
@@ -1160,7 +1377,8 @@ class NestedListSetting(IterableSetting):
 
     def transform(self, value):
         """Transform each item in the list."""
-        return tuple(self.inner_setting.transform(item) for item in value)
+        transform_item = self.inner_setting.transform
+        return tuple([transform_item(item) for item in value])
 
 
 class FileSetting(Setting):
@@ -1170,6 +1388,8 @@ class FileSetting(Setting):
     Value of this setting is a pathlib.Path instance.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         name="",
@@ -1214,4 +1434,4 @@ class FileSetting(Setting):
 
     def transform(self, value):
         """Transform value to Path instance."""
-        return Path(super().transform(value))
+        return _to_path(super().transform(value))
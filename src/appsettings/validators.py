@@ -2,6 +2,7 @@
 import os
 
 from django.core.exceptions import ValidationError
+from django.core.validators import MaxLengthValidator, MaxValueValidator, MinLengthValidator, MinValueValidator
 
 
 class TypeValidator(object):
@@ -31,8 +32,9 @@ class ValuesTypeValidator(object):
             self.message = message
 
     def __call__(self, value):
+        value_type = self.value_type
         for element in value:
-            if not isinstance(element, self.value_type):
+            if not isinstance(element, value_type):
                 params = {"value": element, "type": self.value_type.__name__}
                 raise ValidationError(self.message, params=params)
 
@@ -48,8 +50,9 @@ class DictKeysTypeValidator(object):
             self.message = message
 
     def __call__(self, value):
+        key_type = self.key_type
         for key in value:
-            if not isinstance(key, self.key_type):
+            if not isinstance(key, key_type):
                 params = {"key": key, "type": self.key_type.__name__}
                 raise ValidationError(self.message, params=params)
 
@@ -65,12 +68,66 @@ class DictValuesTypeValidator(object):
             self.message = message
 
     def __call__(self, value):
+        value_type = self.value_type
         for key, element in value.items():
-            if not isinstance(element, self.value_type):
+            if not isinstance(element, value_type):
                 params = {"key": key, "value": element, "type": self.value_type.__name__}
                 raise ValidationError(self.message, params=params)
 
 
+class RangeValidator(object):
+    """Validator which checks the value is within bounds (both included)."""
+
+    min_message = MinValueValidator.message
+    max_message = MaxValueValidator.message
+    min_code = "min_value"
+    max_code = "max_value"
+
+    def __init__(self, minimum=None, maximum=None, min_message=None, max_message=None):
+        """
+        Validator initialization.
+
+        Args:
+            minimum (optional): Lower bound, not checked if None.
+            maximum (optional): Upper bound, not checked if None.
+            min_message (str): Override default ``ValidationError`` message when the lower bound is not met.
+            max_message (str): Override default ``ValidationError`` message when the upper bound is exceeded.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        if min_message:
+            self.min_message = min_message
+        if max_message:
+            self.max_message = max_message
+
+    def clean(self, value):
+        """Return the quantity to compare with the bounds."""
+        return value
+
+    def __call__(self, value):
+        """Validate the ``value``."""
+        cleaned = self.clean(value)
+        if self.minimum is not None and cleaned < self.minimum:
+            params = {"limit_value": self.minimum, "show_value": cleaned, "value": value}
+            raise ValidationError(self.min_message, code=self.min_code, params=params)
+        if self.maximum is not None and cleaned > self.maximum:
+            params = {"limit_value": self.maximum, "show_value": cleaned, "value": value}
+            raise ValidationError(self.max_message, code=self.max_code, params=params)
+
+
+class LengthRangeValidator(RangeValidator):
+    """Validator which checks the length of the value is within bounds (both included)."""
+
+    min_message = MinLengthValidator.message
+    max_message = MaxLengthValidator.message
+    min_code = "min_length"
+    max_code = "max_length"
+
+    def clean(self, value):
+        """Return the length of the value."""
+        return len(value)
+
+
 class FileValidator(object):
     """Validator which checks file existence and permissions."""
 
@@ -1,11 +1,14 @@
 """Main test script."""
+import copy
 import os
 import tempfile
+import warnings
 from pathlib import Path
 from typing import Dict, cast
 from unittest import mock
 
 import pytest
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.test import SimpleTestCase, override_settings
 
@@ -49,6 +52,10 @@ class SettingTestCase(SimpleTestCase):
         assert setting.name == "Name"
         assert setting.prefix == "Prefix_"
         assert setting.full_name == "PREFIX_NAME"
+        setting.name = "Other_name"
+        assert setting.full_name == "PREFIX_OTHER_NAME"
+        setting.prefix = "Other_prefix_"
+        assert setting.full_name == "OTHER_PREFIX_OTHER_NAME"
 
     def test_setting_default_callable(self):
         setting = appsettings.Setting(default=lambda: 1, call_default=True)
@@ -158,6 +165,18 @@ class SettingTestCase(SimpleTestCase):
             setting.check()
             assert setting.raw_value == "value"
 
+        setting.parent_setting = None
+        with override_settings(SETTING="other", PARENT_SETTING=["value"]):
+            assert setting.raw_value == "other"
+
+    def test_setting_copy_raw_value(self):
+        setting = appsettings.Setting(name="setting")
+        copied = copy.copy(setting)
+        copied.name = "other"
+        with override_settings(SETTING="value", OTHER="other value"):
+            assert setting.raw_value == "value"
+            assert copied.raw_value == "other value"
+
     @mock.patch.dict(os.environ, {"PREFERENCE_SETTING": '"__ENV__"'})
     def test_preference_of_environ_values(self):
         setting = appsettings.Setting(name="preference_setting")
@@ -165,6 +184,16 @@ class SettingTestCase(SimpleTestCase):
             setting.check()
             assert setting.value == "__ENV__"
 
+    @mock.patch.dict(os.environ, {"SETTING": '"value"'})
+    def test_environ_deprecation_warned_once(self):
+        setting = appsettings.Setting(name="setting")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert setting.value == "value"
+            assert setting.value == "value"
+        assert len(caught) == 1
+        assert caught[0].category is DeprecationWarning
+
     @mock.patch.dict(os.environ, {"SETTING": '{"key": ["v", "a", "l"]}'})
     def test_json_from_environ_value(self):
         setting = appsettings.Setting(name="setting")
@@ -319,6 +348,25 @@ class StringSettingTestCase(SimpleTestCase):
         setting.check()
         assert setting.value == "pure-string"
 
+    @mock.patch("appsettings.settings._emitted_deprecations", set())
+    def test_string_setting_empty_deprecation_warned_once(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            appsettings.StringSetting(empty=False)
+            appsettings.StringSetting(empty=False)
+        assert len(caught) == 1
+        assert caught[0].category is DeprecationWarning
+
+    @mock.patch("appsettings.settings._emitted_deprecations", set())
+    def test_empty_deprecation_warned_per_setting_class(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            appsettings.ListSetting(empty=False)
+            appsettings.StringSetting(empty=False)
+        assert len(caught) == 2
+        assert all(warning.category is DeprecationWarning for warning in caught)
+        assert all(warning.filename == __file__ for warning in caught)
+
 
 class ListSettingTestCase(SimpleTestCase):
     """ListSetting tests."""
@@ -383,6 +431,12 @@ class DictSettingTestCase(SimpleTestCase):
         setting.check()
         assert setting.value == {"a": 1, "b": 2}
 
+    @mock.patch.dict(os.environ, {"SETTING": "a=A=1 b=B"})
+    def test_dict_setting_from_environ_delimiter_in_value(self):
+        setting = appsettings.DictSetting(name="setting")
+        setting.check()
+        assert setting.value == {"a": "A=1", "b": "B"}
+
 
 class ObjectSettingTestCase(SimpleTestCase):
     """ObjectSetting tests."""
@@ -410,6 +464,21 @@ class ObjectSettingTestCase(SimpleTestCase):
         with override_settings(OBJECT=None):
             assert setting.value is None
 
+    def test_object_setting_top_level_module(self):
+        setting = appsettings.ObjectSetting(name="object")
+        with override_settings(OBJECT="os"):
+            assert setting.value is os
+        with override_settings(OBJECT="this_module_does_not_exist"):
+            with pytest.raises(ImportError, match="this_module_does_not_exist"):
+                assert setting.value
+
+    def test_object_setting_patched_object(self):
+        setting = appsettings.ObjectSetting(name="object")
+        with override_settings(OBJECT="tests.test_appsettings.imported_object"):
+            assert setting.value is imported_object
+            with mock.patch("tests.test_appsettings.imported_object", mock.sentinel.patched):
+                assert setting.value is mock.sentinel.patched
+
     @mock.patch.dict(os.environ, {"SETTING": "tests.test_appsettings.imported_object"})
     def test_object_setting_from_environ_value(self):
         setting = appsettings.ObjectSetting(name="setting")
@@ -738,8 +807,10 @@ class AppSettingsTestCase(SimpleTestCase):
         assert appconf.setting == AppConf.setting.get_value()
         assert AppConf.setting is AppConf.settings["setting"]
         assert AppConf.settings is AppConf._meta.settings
+        with pytest.raises(TypeError):
+            AppConf.settings["other"] = appsettings.Setting()
         with pytest.raises(AttributeError):
-            assert not AppConf.not_a_setting
+            assert not AppConf.not_a_setting  # type: ignore
 
         with pytest.raises(RuntimeError):
             assert not appsettings.AppSettings()
@@ -790,34 +861,106 @@ class AppSettingsTestCase(SimpleTestCase):
             my_int = appsettings.IntegerSetting()
 
         appconf = AppConf()
-        assert "my_int" not in appconf._cache
+        assert "my_int" not in appconf.__dict__
         assert appconf.my_int == 0
-        assert "my_int" in appconf._cache
-        assert appconf._cache["my_int"] == 0
+        assert "my_int" in appconf.__dict__
+        assert appconf.__dict__["my_int"] == 0
         assert appconf.my_int == 0
         appconf.invalidate_cache()
-        assert "my_int" not in appconf._cache
+        assert "my_int" not in appconf.__dict__
         with pytest.raises(AttributeError):
-            assert not appconf.not_a_setting
+            assert not appconf.not_a_setting  # type: ignore
+
+    def test_caching_instance_attribute(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+
+        appconf = AppConf()
+        assert "my_int" not in appconf.__dict__
+        assert appconf.my_int == 0
+        assert appconf.__dict__["my_int"] == 0
+        appconf.invalidate_cache()
+        assert "my_int" not in appconf.__dict__
+        with mock.patch.dict(os.environ, {"MY_INT": "2"}):
+            appconf.invalidate_cache()
+            assert appconf.my_int == 2
+            appconf.invalidate_cache()
+        with override_settings(MY_INT=1):
+            assert appconf.my_int == 1
+        assert appconf.my_int == 0
+
+    def test_new_instance_sees_changes_without_signal(self):
+        class AppConf(appsettings.AppSettings):
+            my_str = appsettings.StringSetting()
+            my_int = appsettings.IntegerSetting()
+
+        appconf = AppConf()
+        assert appconf.my_str == ""
+        assert appconf.my_int == 0
+        with mock.patch.dict(os.environ, {"MY_STR": "env"}):
+            assert AppConf().my_str == "env"
+        with mock.patch.object(settings, "MY_INT", 5, create=True):
+            assert AppConf().my_int == 5
+        assert appconf.my_str == ""
+        assert appconf.my_int == 0
+
+    def test_preload(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            my_object = appsettings.ObjectSetting()
+
+        appconf = AppConf()
+        with override_settings(MY_OBJECT="tests.test_appsettings.imported_object"):
+            appconf.preload()
+            assert appconf.__dict__["my_int"] == 0
+            assert appconf.__dict__["my_object"] is imported_object
 
     def test_invalidate_on_signal(self):
         class AppConf(appsettings.AppSettings):
             my_int = appsettings.IntegerSetting()
 
         appconf = AppConf()
-        assert "my_int" not in appconf._cache
+        assert "my_int" not in appconf.__dict__
         assert appconf.my_int == 0
-        assert "my_int" in appconf._cache
-        assert appconf._cache["my_int"] == 0
+        assert "my_int" in appconf.__dict__
+        assert appconf.__dict__["my_int"] == 0
 
         with override_settings(MY_INT=1):
-            assert "my_int" not in appconf._cache
+            assert "my_int" not in appconf.__dict__
             assert appconf.my_int == 1
-            assert "my_int" in appconf._cache
-            assert appconf._cache["my_int"] == 1
+            assert "my_int" in appconf.__dict__
+            assert appconf.__dict__["my_int"] == 1
+
+        assert "my_int" not in appconf.__dict__
+        assert appconf.my_int == 0
+
+    def test_invalidate_on_signal_all_instances(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
 
-        assert "my_int" not in appconf._cache
+        appconfs = [AppConf(), AppConf()]
+        assert len(AppConf._instances) == 2
+        assert [appconf.my_int for appconf in appconfs] == [0, 0]
+        with override_settings(MY_INT=1):
+            assert [appconf.my_int for appconf in appconfs] == [1, 1]
+        assert [appconf.my_int for appconf in appconfs] == [0, 0]
+
+    def test_invalidate_on_unrelated_signal(self):
+        class AppConf(appsettings.AppSettings):
+            my_int = appsettings.IntegerSetting()
+            my_str = appsettings.StringSetting()
+
+        appconf = AppConf()
         assert appconf.my_int == 0
+        assert appconf.my_str == ""
+
+        with override_settings(NOT_MY_SETTING=1):
+            assert "my_int" in appconf.__dict__
+            assert "my_str" in appconf.__dict__
+
+        with override_settings(MY_INT=1):
+            assert "my_int" not in appconf.__dict__
+            assert "my_str" in appconf.__dict__
 
     @mock.patch.dict(os.environ, {"ONE": "Env_1", "TWO": "Env_2", "THREE": "Env_3"})
     def test_environ_values_invalidation(self):
@@ -889,6 +1032,11 @@ class AppSettingsTestCase(SimpleTestCase):
     def test_check(self):
         assert appsettings.AppSettings.check() is None
 
+        class EmptyAppConf(appsettings.AppSettings):
+            pass
+
+        assert EmptyAppConf.check() is None
+
         class AppConf(appsettings.AppSettings):
             setting = appsettings.Setting()
 
@@ -898,3 +1046,54 @@ class AppSettingsTestCase(SimpleTestCase):
 
         with pytest.raises(ImproperlyConfigured):
             assert not AppConf.check()
+
+    def test_inherited_settings(self):
+        class ParentAppConf(appsettings.AppSettings):
+            parent_int = appsettings.IntegerSetting()
+
+        class ChildAppConf(ParentAppConf):
+            child_int = appsettings.IntegerSetting()
+
+        assert set(ChildAppConf.settings) == {"parent_int", "child_int"}
+        assert ChildAppConf.settings["parent_int"] is ParentAppConf.settings["parent_int"]
+        assert set(ParentAppConf.settings) == {"parent_int"}
+        appconf = ChildAppConf()
+        assert appconf.parent_int == 0
+        with override_settings(PARENT_INT=7):
+            assert appconf.parent_int == 7
+            assert ChildAppConf().parent_int == 7
+        assert appconf.parent_int == 0
+
+        ChildAppConf.settings["parent_int"].required = True
+        with pytest.raises(ImproperlyConfigured):
+            ChildAppConf.check()
+
+    def test_invalidate_settings_sharing_full_name(self):
+        class AppConf(appsettings.AppSettings):
+            a = appsettings.IntegerSetting(name="same")
+            b = appsettings.IntegerSetting(name="same")
+
+        appconf = AppConf()
+        assert (appconf.a, appconf.b) == (0, 0)
+        with override_settings(SAME=3):
+            assert (appconf.a, appconf.b) == (3, 3)
+        assert (appconf.a, appconf.b) == (0, 0)
+
+    def test_invalidate_inherited_settings_sharing_full_name(self):
+        class ParentAppConf(appsettings.AppSettings):
+            a = appsettings.IntegerSetting(name="same")
+
+        class ChildAppConf(ParentAppConf):
+            b = appsettings.IntegerSetting(name="same")
+
+        appconf = ChildAppConf()
+        assert (appconf.a, appconf.b) == (0, 0)
+        with override_settings(SAME=3):
+            assert (appconf.a, appconf.b) == (3, 3)
+        assert (appconf.a, appconf.b) == (0, 0)
+
+    def test_setting_name_conflict(self):
+        with pytest.raises(ImproperlyConfigured):
+
+            class AppConf(appsettings.AppSettings):
+                check = appsettings.BooleanSetting()  # type: ignore
@@ -11,6 +11,8 @@ from appsettings import (
     DictKeysTypeValidator,
     DictValuesTypeValidator,
     FileValidator,
+    LengthRangeValidator,
+    RangeValidator,
     TypeValidator,
     ValuesTypeValidator,
 )
@@ -64,6 +66,43 @@ class DictValuesTypeValidatorTestCase(SimpleTestCase):
             DictValuesTypeValidator(int)({"a": 42, "b": None})
 
 
+class RangeValidatorTestCase(SimpleTestCase):
+    """Test RangeValidator."""
+
+    def test_valid(self):
+        RangeValidator(0, 10)(0)
+        RangeValidator(0, 10)(10)
+        RangeValidator(minimum=0)(1676)
+        RangeValidator(maximum=0)(-1676)
+
+    def test_invalid(self):
+        with self.assertRaisesMessage(ValidationError, "Ensure this value is greater than or equal to 0."):
+            RangeValidator(0, 10)(-1)
+        with self.assertRaisesMessage(ValidationError, "Ensure this value is less than or equal to 10."):
+            RangeValidator(0, 10)(11)
+
+    def test_error_message(self):
+        with self.assertRaisesMessage(ValidationError, "-1 is too low!"):
+            RangeValidator(0, 10, min_message="%(value)s is too low!")(-1)
+        with self.assertRaisesMessage(ValidationError, "11 is too high!"):
+            RangeValidator(0, 10, max_message="%(value)s is too high!")(11)
+
+
+class LengthRangeValidatorTestCase(SimpleTestCase):
+    """Test LengthRangeValidator."""
+
+    def test_valid(self):
+        LengthRangeValidator(1, 2)("a")
+        LengthRangeValidator(1, 2)([1, 2])
+        LengthRangeValidator(minimum=1)({"a": 1})
+
+    def test_invalid(self):
+        with self.assertRaisesMessage(ValidationError, "Ensure this value has at least 1 character (it has 0)."):
+            LengthRangeValidator(1, 2)("")
+        with self.assertRaisesMessage(ValidationError, "Ensure this value has at most 2 characters (it has 3)."):
+            LengthRangeValidator(1, 2)("abc")
+
+
 class FileValidatorTestCase(SimpleTestCase):
     """Test FileValidator."""
 